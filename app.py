@@ -13,47 +13,233 @@ import io
 import os
 import sys
 import ast
+import glob
+import shutil
 import json
+import tempfile
 import datetime as dt
 import dateutil
 import dateutil.relativedelta
 import requests
+import requests.adapters
+import urllib3
 import pandas as pd
 import geopandas as gpd
 import folium
 import streamlit as st
-
-from streamlit_folium import st_folium
+import streamlit.components.v1 as components
 
 import branca as bc
 
 # dossier racine où se trouvent les données récupérées et à présenter
 Racine = "./donnees"
 
+# nombre de fichiers journaliers de zones d'arrêtés conservés sur disque
+NB_FICHIERS_ZONES = 5
+
 #-------------------------------------------------------------------------------
 
-def get_zones_secheresse():
-    """Requête de récupération des zones d'arrêté sécheresse.
-    Renvoie uniquement les zones de type 'SUP' pour les eaux superficielles
+@st.cache_resource
+def get_session_http():
+    """Session HTTP partagée : réutilisation des connexions vers data.gouv.fr
+    et nouvelles tentatives en cas d'échec.
+    Mise en cache dans l'application Streamlit pour conserver la même session
+    d'une exécution du script à l'autre
+    (ATTENTION, vérification certificat SSL désactivée)
 
     Returns:
-        geoDataFrame: zones filtrées sur le type 'SUP'
+        Session: session requests
+    """
+    session = requests.Session()
+    session.verify = False
+    session.mount("https://",
+                  requests.adapters.HTTPAdapter(pool_connections=2,
+                                                pool_maxsize=2,
+                                                max_retries=urllib3.Retry(total=3,
+                                                                          backoff_factor=0.5),
+                                                ))
+    return session
+
+#-------------------------------------------------------------------------------
+
+def telecharger_zones_secheresse(entetes):
+    """Téléchargement des zones d'arrêté sécheresse depuis data.gouv.fr.
+    Requête conditionnelle selon les entêtes HTTP du dernier téléchargement :
+    rien n'est téléchargé si le fichier n'a pas changé depuis.
+    Seules les zones de type 'SUP' sont lues
+
+    Args:
+        entetes (dict): entêtes 'etag' et 'last_modified' du dernier téléchargement
+        (dictionnaire vide si aucun)
+
+    Returns:
+        (geoDataFrame,dict): (zones filtrées sur le type 'SUP', entêtes de la réponse).
+        Les zones valent None si le fichier n'a pas changé
     """
     # URL stable de la couche
     url_zones_arretes = "https://www.data.gouv.fr/fr/datasets/r/bfba7898-aed3-40ec-aa74-abb73b92a363"
 
-    # requête du fichier (ATTENTION, vérification certificat SSL désactivée)
-    rep = requests.get(url_zones_arretes, verify=False)
+    # entêtes de la requête conditionnelle
+    entetes_requete = {}
+    if entetes.get("etag"):
+        entetes_requete["If-None-Match"] = entetes["etag"]
+    if entetes.get("last_modified"):
+        entetes_requete["If-Modified-Since"] = entetes["last_modified"]
+
+    # requête du fichier (session HTTP partagée)
+    with get_session_http().get(url_zones_arretes, stream=True, headers=entetes_requete) as rep:
+        # fichier inchangé depuis le dernier téléchargement
+        if rep.status_code == 304:
+            return None, entetes
+        rep.raise_for_status()
+
+        entetes = {"etag": rep.headers.get("ETag"),
+                   "last_modified": rep.headers.get("Last-Modified")}
+
+        # écriture en flux dans un fichier temporaire pour une lecture directe par GDAL (pyogrio),
+        # supprimé en fin de lecture comme en cas d'échec du téléchargement
+        ftmp = tempfile.NamedTemporaryFile(suffix=".geojson", delete=False)
+        try:
+            with ftmp:
+                # décompression éventuelle (gzip...) du flux brut
+                rep.raw.decode_content = True
+                shutil.copyfileobj(rep.raw, ftmp, length=1<<20)
+            # dans geopandas : filtre sur le type 'SUP' évalué par GDAL avant construction
+            # des géométries, et lecture des seules colonnes utilisées
+            zones_arretes = gpd.read_file(ftmp.name,
+                                          engine="pyogrio",
+                                          use_arrow=True,
+                                          where="type = 'SUP'",
+                                          columns=["niveauGravite", "departement"],
+                                          )
+        finally:
+            os.remove(ftmp.name)
+    # fin
+    return zones_arretes, entetes
+
+#-------------------------------------------------------------------------------
+
+def code_departement(departement):
+    """Extraction du code de département de l'attribut 'departement' d'une zone d'arrêté.
+    Selon la version de pyogrio, l'objet JSON est lu en dictionnaire ou en chaîne de caractères
 
-    fio = io.BytesIO(rep.content)
-    # dans geopandas
-    zones_arretes = gpd.read_file(fio)
+    Args:
+        departement (dict|str): attribut 'departement', de la forme {"code": ..., "nom": ...}
+
+    Returns:
+        str: code du département
+    """
+    if isinstance(departement, dict):
+        return departement['code']
+    return json.loads(departement)['code']
+
+#-------------------------------------------------------------------------------
+
+def fichier_intermediaire_zones(fic_zones):
+    """Nom du fichier intermédiaire d'écriture des zones (Racine/tmp_zones_yyyymmdd.gpkg) :
+    extension '.gpkg' attendue par GDAL, et nom non concerné par la suppression
+    des fichiers journaliers les plus anciens
+
+    Args:
+        fic_zones (str): nom du fichier GeoPackage des zones du jour
+
+    Returns:
+        str: nom du fichier intermédiaire
+    """
+    return os.path.join(os.path.dirname(fic_zones), "tmp_" + os.path.basename(fic_zones))
+
+#-------------------------------------------------------------------------------
+
+def sauvegarder_zones(zones_arretes, fic_zones):
+    """Sauvegarde sur disque des zones d'arrêté sécheresse au format GeoPackage
+    (écriture dans un fichier intermédiaire puis renommage).
+    L'attribut 'departement' est écrit en chaîne JSON pour être relu à l'identique
+
+    Args:
+        zones_arretes (geoDataFrame): zones à sauvegarder
+        fic_zones (str): nom du fichier GeoPackage à écrire
+    """
+    # objet JSON lu en dictionnaire par pyogrio : conversion en chaîne JSON
+    zones_gpkg = zones_arretes.assign(departement=zones_arretes['departement'].apply(
+        lambda x: json.dumps(x, ensure_ascii=False) if isinstance(x, dict) else x))
+    fic_tmp = fichier_intermediaire_zones(fic_zones)
+    zones_gpkg.to_file(fic_tmp, driver="GPKG", engine="pyogrio")
+    os.replace(fic_tmp, fic_zones)
 
-    # on ne garde que le type 'SUP'
-    zones_arretes = zones_arretes[zones_arretes["type"] == "SUP"]
+#-------------------------------------------------------------------------------
+
+def supprimer_zones_anciennes():
+    """Suppression des fichiers journaliers de zones d'arrêté les plus anciens,
+    seuls les NB_FICHIERS_ZONES plus récents sont conservés
+    """
+    # noms de fichier zones_yyyymmdd.gpkg : l'ordre alphabétique est l'ordre chronologique
+    fichiers = sorted(glob.glob(os.path.join(Racine, "zones_*.gpkg")))
+    for fichier in fichiers[:-NB_FICHIERS_ZONES]:
+        os.remove(fichier)
+
+#-------------------------------------------------------------------------------
+
+@st.cache_data(ttl=dt.timedelta(hours=6), show_spinner=False)
+def get_zones_secheresse(cle_jour):
+    """Requête de récupération des zones d'arrêté sécheresse.
+    Renvoie uniquement les zones de type 'SUP' pour les eaux superficielles.
+    Activation du cache dans l'application Streamlit, renouvelé au changement de jour.
+    Les zones du jour sont aussi conservées sur disque (Racine/zones_yyyymmdd.gpkg)
+    pour ne pas être téléchargées à nouveau après un redémarrage de l'application,
+    avec les entêtes HTTP du téléchargement (Racine/zones_entetes.json) pour
+    ne pas télécharger à nouveau un fichier inchangé les jours suivants
+
+    Args:
+        cle_jour (str): date du jour au format iso (yyyy-mm-dd), clé du cache
+
+    Returns:
+        geoDataFrame: zones filtrées sur le type 'SUP'
+    """
+    # fichier local des zones du jour
+    jour = dt.date.fromisoformat(cle_jour)
+    fic_zones = os.path.join(Racine, f"zones_{jour:%Y%m%d}.gpkg")
+
+    if os.path.exists(fic_zones):
+        # zones déjà récupérées ce jour (déjà filtrées sur le type 'SUP')
+        zones_arretes = gpd.read_file(fic_zones, engine="pyogrio", use_arrow=True)
+    else:
+        # entêtes HTTP du dernier téléchargement, pris en compte uniquement
+        # si le fichier de zones correspondant est toujours présent
+        fic_entetes = os.path.join(Racine, "zones_entetes.json")
+        entetes = {}
+        if os.path.exists(fic_entetes):
+            try:
+                with open(fic_entetes, encoding="utf-8") as fentetes:
+                    entetes = json.load(fentetes)
+            except (json.JSONDecodeError, OSError):
+                # fichier illisible : téléchargement complet
+                entetes = {}
+        fic_precedent = os.path.join(Racine, entetes.get("fichier", ""))
+        if not os.path.isfile(fic_precedent):
+            entetes = {}
+
+        zones_arretes, entetes = telecharger_zones_secheresse(entetes)
+        if zones_arretes is None:
+            # fichier inchangé : reprise des zones du dernier téléchargement
+            # (copie dans un fichier intermédiaire puis renommage)
+            fic_tmp = fichier_intermediaire_zones(fic_zones)
+            shutil.copyfile(fic_precedent, fic_tmp)
+            os.replace(fic_tmp, fic_zones)
+            zones_arretes = gpd.read_file(fic_zones, engine="pyogrio", use_arrow=True)
+        else:
+            sauvegarder_zones(zones_arretes, fic_zones)
+
+        # sauvegarde des entêtes associés au fichier du jour
+        # (écriture dans un fichier intermédiaire puis renommage)
+        entetes["fichier"] = os.path.basename(fic_zones)
+        fic_entetes_part = fic_entetes + ".part"
+        with open(fic_entetes_part, "w", encoding="utf-8") as fentetes:
+            json.dump(entetes, fentetes)
+        os.replace(fic_entetes_part, fic_entetes)
+        supprimer_zones_anciennes()
 
     # gestion du code de département des zones d'arrêtés
-    zones_arretes['insee_dept'] = zones_arretes['departement'].apply(lambda x: json.loads(x)['code'])
+    zones_arretes['insee_dept'] = zones_arretes['departement'].apply(code_departement)
 
     # filtre pour ne conserver que l'affichage des départements de métropole (longueur de code dept < 3)
     zones_arretes = zones_arretes.where(zones_arretes["insee_dept"].apply(lambda x:len(x)<3))
@@ -66,20 +252,40 @@ def get_zones_secheresse():
 
 @st.cache_data
 def lire_geopandas(fic_couche):
-    """lecture de la couche depuis le fichier passé en paramètre.
+    """lecture de la couche depuis le fichier passé en paramètre, avec conversion
+    du CRS en wgs 84 si nécessaire.
     Activation du cache dans l'application Streamlit
 
     Args:
         fic_couche (str): nom de fichier local à lire
 
     Returns:
-        GeoDataFrame: couche lue
+        GeoDataFrame: couche lue, en EPSG:4326
     """
-    gdf = gpd.read_file(fic_couche)
+    gdf = gpd.read_file(fic_couche, engine="pyogrio", use_arrow=True)
+    # conversion du CRS en wgs 84, une seule fois grâce au cache
+    if gdf.crs != "EPSG:4326":
+        gdf = gdf.to_crs("EPSG:4326")
     return gdf
 
 #-------------------------------------------------------------------------------
 
+@st.cache_data
+def lire_limites_couche(fic_couche):
+    """calcul des limites (emprise) de la couche lue depuis le fichier passé en paramètre.
+    Activation du cache dans l'application Streamlit
+
+    Args:
+        fic_couche (str): nom de fichier local à lire
+
+    Returns:
+        tuple: limites (minx, miny, maxx, maxy) de la couche en EPSG:4326
+    """
+    gdf = lire_geopandas(fic_couche)
+    return tuple(float(v) for v in gdf.total_bounds)
+
+#-------------------------------------------------------------------------------
+
 @st.cache_data
 def get_arretes():
     """Requête de récupération des arrêtés de restriction archivés
@@ -90,8 +296,8 @@ def get_arretes():
     # url des archives des arrêtés
     url_arretes = "https://www.data.gouv.fr/fr/datasets/r/f425cfa6-ccd1-438e-bb03-9d90ab527851"
 
-    # requête du fichier (ATTENTION, vérification certificat SSL désactivée)
-    rep = requests.get(url_arretes, verify=False)
+    # requête du fichier (session HTTP partagée)
+    rep = get_session_http().get(url_arretes)
 
     # chargement des données dans un dataframe
     fio = io.BytesIO(rep.content)
@@ -104,35 +310,16 @@ def get_arretes():
 
 #-------------------------------------------------------------------------------
 
-def _categorical_legend(m, title, categories, colors):
-    """
-    MODIFICATION POUR POSITIONNER LA LEGENDE
-    FONCTION D'ORIGINE DANS geopandas/explore.py
-
-    --> CHANGEMENT : postition par rapport au coin (left, top) au lieu de (right, bottom)
-
-    Add categorical legend to a map
-
-    The implementation is using the code originally written by Michel Metran
-    (@michelmetran) and released on GitHub
-    (https://github.com/michelmetran/package_folium) under MIT license.
+@st.cache_resource
+def _legend_template():
+    """Entête de la légende des catégories (CSS et script de déplacement), invariant.
+    Mise en cache dans l'application Streamlit pour n'analyser le gabarit Jinja
+    qu'une seule fois pour toutes les cartes construites
 
-    Copyright (c) 2020 Michel Metran
-
-    Parameters
-    ----------
-    m : folium.Map
-        Existing map instance on which to draw the plot
-    title : str
-        title of the legend (e.g. column name)
-    categories : list-like
-        list of categories
-    colors : list-like
-        list of colors (in the same order as categories)
+    Returns:
+        Template: gabarit branca de l'entête de la légende
     """
-
-    # Header to Add
-    head = """
+    return bc.element.Template("""
     {% macro header(this, kwargs) %}
     <script src="https://code.jquery.com/ui/1.12.1/jquery-ui.js"></script>
     <script>$( function() {
@@ -195,25 +382,52 @@ def _categorical_legend(m, title, categories, colors):
         }
     </style>
     {% endmacro %}
+    """)
+
+#-------------------------------------------------------------------------------
+
+def _categorical_legend(m, title, categories, colors):
+    """
+    MODIFICATION POUR POSITIONNER LA LEGENDE
+    FONCTION D'ORIGINE DANS geopandas/explore.py
+
+    --> CHANGEMENT : postition par rapport au coin (left, top) au lieu de (right, bottom)
+
+    Add categorical legend to a map
+
+    The implementation is using the code originally written by Michel Metran
+    (@michelmetran) and released on GitHub
+    (https://github.com/michelmetran/package_folium) under MIT license.
+
+    Copyright (c) 2020 Michel Metran
+
+    Parameters
+    ----------
+    m : folium.Map
+        Existing map instance on which to draw the plot
+    title : str
+        title of the legend (e.g. column name)
+    categories : list-like
+        list of categories
+    colors : list-like
+        list of colors (in the same order as categories)
     """
 
-    # Add CSS (on Header)
+    # Add CSS (on Header), cached template
     macro = bc.element.MacroElement()
-    macro._template = bc.element.Template(head)
+    macro._template = _legend_template()
     m.get_root().add_child(macro)
 
+    # Categories
+    labels = "".join(f"""
+                <li><span style='background:{color}'></span>{label}</li>"""
+                     for label, color in zip(categories, colors))
+
     body = f"""
     <div id='maplegend {title}' class='maplegend'>
         <div class='legend-title'>{title}</div>
         <div class='legend-scale'>
-            <ul class='legend-labels'>"""
-
-    # Loop Categories
-    for label, color in zip(categories, colors):
-        body += f"""
-                <li><span style='background:{color}'></span>{label}</li>"""
-
-    body += """
+            <ul class='legend-labels'>{labels}
             </ul>
         </div>
     </div>
@@ -225,11 +439,12 @@ def _categorical_legend(m, title, categories, colors):
 
 #-------------------------------------------------------------------------------
 
-def construire_carte(itineraire, zones_arrete, dept_iti):
+def construire_carte(itineraire, bounds, zones_arrete, dept_iti):
     """construction de la carte folium basée sur les deux couches passées en paramètre
 
     Args:
         itineraire (GeoDataFrame): couche des itinéraires COP
+        bounds (tuple): limites (minx, miny, maxx, maxy) des itinéraires COP
         zones_arrete (GeoDataFrame): couche des zones de sécheresse à afficher
         dept_iti (GeoDataFrame): couche des départements en lien avec le réseau de VNF
 
@@ -237,24 +452,21 @@ def construire_carte(itineraire, zones_arrete, dept_iti):
         map: instance de carte folium
     """
 
-    # copie locale
-    czones_arrete = gpd.GeoDataFrame(zones_arrete)
-
     # codes couleur des zones d'arrêtés selon le niveau de gravité
     niveaux  = ["vigilance", "alerte",  "alerte renforcée", "crise"]
     couleurs = ["#ffeda0",   "#feb24c", "#fc4e2a",          "#b10026"]
-    czones_arrete["couleur"] = czones_arrete["niveauGravite"].map(dict(zip(niveaux,couleurs)))
 
     # carte centrée sur ce point choisi manuellement
     centre = [46.463,2.661]
-    # limites : celle des itinéraires
-    bounds =itineraire.total_bounds
 
+    # rendu des couches vectorielles dans un canvas plutôt qu'en SVG
     carte = folium.Map(
         location=centre,
         tiles="OpenStreetMap",
+        prefer_canvas=True,
     )
 
+    # limites : celles des itinéraires (bounds)
     carte.fit_bounds([[bounds[1],bounds[0]],
                       [bounds[3],bounds[2]]])
 
@@ -265,17 +477,31 @@ def construire_carte(itineraire, zones_arrete, dept_iti):
                   ).add_to(carte)
 
     # ajout des zones d'arrêté avec contrôle de la légende
-    czones_arrete.explore(m=carte,
-        column='niveauGravite',
-        tooltip=['niveauGravite', 'departement'],
-        categorical=True,
-        categories=niveaux,
-        k=len(niveaux),
-        cmap=couleurs,
-        popup=True,
-        legend=False,
-        name= "Zones d'arrêtés sécheresse",
-        )
+    # regroupement des zones par niveau de gravité : une entité multipolygone par niveau,
+    # après correction des géométries invalides qui feraient échouer l'union
+    zones_carte = zones_arrete[['niveauGravite', 'geometry']]
+    zones_carte = zones_carte.assign(geometry=zones_carte.geometry.make_valid())
+    zones_carte = zones_carte.dissolve(by='niveauGravite', as_index=False)
+    # simplification des contours (Douglas-Peucker, tolérance de 0.005° soit environ
+    # 500 m) suffisante à l'échelle de la France
+    zones_carte["geometry"] = zones_carte.geometry.simplify(tolerance=0.005, preserve_topology=True)
+    # une couche par niveau de gravité, avec un style constant (sans lecture des propriétés
+    # de chaque entité), regroupées sous une seule entrée du contrôle des couches
+    groupe_zones = folium.FeatureGroup(name="Zones d'arrêtés sécheresse", overlay=True, control=True)
+    for niveau, couleur in zip(niveaux, couleurs):
+        zones_niveau = zones_carte[zones_carte['niveauGravite'] == niveau]
+        if zones_niveau.empty:
+            continue
+        # zones du niveau au format GeoJSON
+        folium.GeoJson(zones_niveau.to_json(drop_id=True),
+                      name=niveau,
+                      style_function=lambda x, couleur=couleur: {"color": couleur,
+                                                                 "fillColor": couleur,
+                                                                 "fillOpacity": 0.5,
+                                                                 "weight": 2},
+                      tooltip=folium.GeoJsonTooltip(fields=['niveauGravite']),
+                      ).add_to(groupe_zones)
+    groupe_zones.add_to(carte)
 
     # légende "à la main" issue de la fonction d'explore,
     # mais avec positionnement adapté à cette carte
@@ -284,11 +510,16 @@ def construire_carte(itineraire, zones_arrete, dept_iti):
                         categories=niveaux,
                         colors=couleurs)
 
-    # ajout de la couche itinéraire
-    folium.GeoJson(itineraire,
-                  name="Itinéraire COP",
+    # ajout de la couche itinéraire, simplifiée (Douglas-Peucker, tolérance de
+    # 0.001° soit environ 100 m) pour alléger le tracé envoyé au navigateur
+    itineraire_simpl = itineraire.copy()
+    itineraire_simpl["geometry"] = itineraire.geometry.simplify(tolerance=0.001,
+                                                                preserve_topology=True)
+    groupe_itineraire = folium.FeatureGroup(name="Itinéraire COP", overlay=True, control=True)
+    folium.GeoJson(itineraire_simpl,
                   style_function=lambda x: {"color": "#0000ff", "weight": 2},
-                  ).add_to(carte)
+                  ).add_to(groupe_itineraire)
+    groupe_itineraire.add_to(carte)
 
     # ajout du titre de la carte
     title_html = f'''
@@ -305,6 +536,28 @@ def construire_carte(itineraire, zones_arrete, dept_iti):
 
 #-------------------------------------------------------------------------------
 
+@st.cache_data(max_entries=1, show_spinner=False)
+def construire_carte_html(cle_carte, _itineraire, bounds, _zones_arrete, _dept_iti):
+    """construction de la carte folium et rendu en page HTML statique, avec mise en cache
+    dans l'application Streamlit. Les couches (préfixées par '_') ne sont pas hachées
+    par Streamlit : le cache est identifié par la clé passée en paramètre.
+    Seule la dernière carte construite est conservée en cache
+
+    Args:
+        cle_carte (tuple): clé identifiant le contenu de la carte (date, zones affichées)
+        _itineraire (GeoDataFrame): couche des itinéraires COP
+        bounds (tuple): limites (minx, miny, maxx, maxy) des itinéraires COP
+        _zones_arrete (GeoDataFrame): couche des zones de sécheresse à afficher
+        _dept_iti (GeoDataFrame): couche des départements en lien avec le réseau de VNF
+
+    Returns:
+        str: page HTML de la carte folium
+    """
+    carte = construire_carte(_itineraire, bounds, _zones_arrete, _dept_iti)
+    return carte.get_root().render()
+
+#-------------------------------------------------------------------------------
+
 def safe_literal_eval(value):
     """Encapsulation de la fonction ast.literal_eval pour convertir la représentation en str
     d'une liste de valeurs ou une seule valeur en liste
@@ -637,16 +890,17 @@ def main():
     # itinéraires COP
     fic_couche = os.path.join(Racine,"Export_Itineraire_COP.gpkg")
     itineraire = lire_geopandas(fic_couche)
+    # limites de la carte : celles des itinéraires
+    limites_iti = lire_limites_couche(fic_couche)
     # départements réseau VNF
     fic_couche = os.path.join(Racine,"departements_itineraires.gpkg")
     dept_iti = lire_geopandas(fic_couche)
-    # conversion du CRS en wgs 84
-    itineraire = itineraire.to_crs("EPSG:4326")
-    dept_iti   = dept_iti.to_crs("EPSG:4326")
     # zones des arrêtés
-    zones_arretes = get_zones_secheresse()
-    # conversion dans le même CRS que l'itinéraire
-    zones_arretes = zones_arretes.to_crs(itineraire.crs)
+    jour = dt.date.today().isoformat()
+    zones_arretes = get_zones_secheresse(jour)
+    # conversion dans le même CRS que l'itinéraire si nécessaire
+    if zones_arretes.crs != itineraire.crs:
+        zones_arretes = zones_arretes.to_crs(itineraire.crs)
 
     # arrêtés archivés dans le temps
     try:
@@ -664,17 +918,18 @@ def main():
 
     # création de la carte
     data_load_state.text('Construction carte...')
-    carte = construire_carte(itineraire, zones_arretes, dept_iti)
+    cle_carte = (jour, len(zones_arretes), tuple(zones_arretes["niveauGravite"].tolist()))
+    html_carte = construire_carte_html(cle_carte, itineraire, limites_iti, zones_arretes, dept_iti)
     data_load_state.text('Construction carte...Terminé !')
 
     # visualisation
     with tab1:
         data_load_state.text('Visualisation carte...')
-        st_folium(carte,
-                  returned_objects=[], # pour éviter les appels répétés à l'appli
-                  height=700,
-                  width=700,
-                  )
+        # carte statique : aucun échange avec l'appli lors des déplacements sur la carte
+        components.html(html_carte,
+                        height=700,
+                        width=700,
+                        )
         data_load_state.text('Visualisation carte...Terminé !')
     # insertion des indicateurs par département
     with tab2:
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*----------------------------------------------------------
+# Name:        test_app.py
+# Purpose:     Tests de la récupération et de la conservation sur disque
+#              des zones d'arrêtés sécheresse
+#
+# Author:      Alain Gauthier
+#
+# Created:     15/10/2026
+# Licence:     GPL V3
+#-------------------------------------------------------------------------------
+
+import io
+import json
+
+import app
+
+# zones d'arrêtés au format data.gouv.fr : 'departement' est un objet JSON
+ZONES_GEOJSON = {
+    "type": "FeatureCollection",
+    "features": [
+        {"type": "Feature",
+         "properties": {"type": "SUP", "niveauGravite": "crise",
+                        "departement": {"code": "07", "nom": "Ardèche"}},
+         "geometry": {"type": "Polygon",
+                      "coordinates": [[[4.0, 44.5], [4.5, 44.5], [4.5, 45.0], [4.0, 44.5]]]}},
+        {"type": "Feature",
+         "properties": {"type": "SOU", "niveauGravite": "alerte",
+                        "departement": {"code": "75", "nom": "Paris"}},
+         "geometry": {"type": "Polygon",
+                      "coordinates": [[[2.2, 48.8], [2.4, 48.8], [2.4, 48.9], [2.2, 48.8]]]}},
+        {"type": "Feature",
+         "properties": {"type": "SUP", "niveauGravite": "vigilance",
+                        "departement": {"code": "971", "nom": "Guadeloupe"}},
+         "geometry": {"type": "Polygon",
+                      "coordinates": [[[-61.5, 16.0], [-61.2, 16.0], [-61.2, 16.3], [-61.5, 16.0]]]}},
+    ],
+}
+
+#-------------------------------------------------------------------------------
+
+class _ReponseFactice:
+    """Réponse HTTP factice renvoyant le fichier GeoJSON des zones"""
+
+    status_code = 200
+    headers = {"ETag": '"v1"'}
+
+    def __init__(self):
+        self.raw = io.BytesIO(json.dumps(ZONES_GEOJSON).encode("utf-8"))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+class _SessionFactice:
+    """Session HTTP factice comptant les requêtes"""
+
+    def __init__(self):
+        self.nb_requetes = 0
+
+    def get(self, url, **kwargs):
+        self.nb_requetes += 1
+        return _ReponseFactice()
+
+#-------------------------------------------------------------------------------
+
+def test_zones_relues_depuis_disque(tmp_path, monkeypatch):
+    """Les zones conservées sur disque sont relues à l'identique sans nouveau téléchargement"""
+    session = _SessionFactice()
+    monkeypatch.setattr(app, "Racine", str(tmp_path))
+    monkeypatch.setattr(app, "get_session_http", lambda: session)
+
+    # téléchargement puis sauvegarde sur disque
+    app.get_zones_secheresse.clear()
+    zones = app.get_zones_secheresse("2026-10-15")
+    assert list(zones["insee_dept"]) == ["07"]
+    assert (tmp_path / "zones_20261015.gpkg").exists()
+
+    # relecture depuis le disque (cache Streamlit vidé, comme après un redémarrage)
+    app.get_zones_secheresse.clear()
+    zones = app.get_zones_secheresse("2026-10-15")
+    assert session.nb_requetes == 1
+    assert list(zones["insee_dept"]) == ["07"]
+    assert list(zones["niveauGravite"]) == ["crise"]
+    app.get_zones_secheresse.clear()